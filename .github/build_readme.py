@@ -4,9 +4,17 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 README_PATH = ROOT / "README.md"
 DEVICES_DIR = ROOT / "devices"
@@ -14,14 +22,49 @@ DEVICES_DIR = ROOT / "devices"
 START_MARKER = "<!-- DEVICE_DASHBOARD_START -->"
 END_MARKER = "<!-- DEVICE_DASHBOARD_END -->"
 
+_TABLE_HEADER = (
+    "| Device | Day | Details |",
+    "|--------|-----|---------|",
+)
+_ACTIVE_SECTION = (
+    START_MARKER,
+    "Auto-generated from `devices/*/public/status.json`",
+    "",
+    "---",
+    "",
+    "## 🟢 Active",
+    "",
+    *_TABLE_HEADER,
+)
+_TERMINATED_SECTION = (
+    "",
+    "---",
+    "",
+    "## 🔴 Terminated",
+    "",
+    *_TABLE_HEADER,
+)
+_EMPTY_ROW = "| - | 0 | - |"
+_CELL_WHITESPACE = str.maketrans({"\n": " ", "\r": " "})
+
 
 def _table_cell(value: Any, *, max_len: int = 120) -> str:
-    text = str(value or "").replace("\n", " ").strip()
+    return _clip_cell(str(value or ""), max_len)
+
+
+@lru_cache(maxsize=2048)
+def _clip_cell(text: str, max_len: int) -> str:
+    # Status, day and placeholder cells repeat across devices; normalize each once.
+    text = text.translate(_CELL_WHITESPACE).strip()
     if len(text) > max_len:
         text = text[: max_len - 1].rstrip() + "..."
     return text.replace("|", "\\|")
 
 
+def _s(value: Any, default: str = "-") -> str:
+    return (str(value).strip() if value else "") or default
+
+
 def _detail_cell(*, purpose: str, last_activity: str, becoming: str = "") -> str:
     parts = [f"**Purpose:** {purpose}"]
     if becoming:
@@ -30,30 +73,86 @@ def _detail_cell(*, purpose: str, last_activity: str, becoming: str = "") -> str
     return "<br>".join(parts)
 
 
+def _status_paths() -> list[str]:
+    # Only the device directory is a wildcard, so list it once and join the
+    # literal tail instead of letting glob stat every intermediate segment.
+    try:
+        with os.scandir(DEVICES_DIR) as entries:
+            device_dirs = sorted(
+                entry.path for entry in entries if entry.is_dir() and not entry.name.startswith(".")
+            )
+    except FileNotFoundError:
+        return []
+    return [os.path.join(device_dir, "public", "status.json") for device_dir in device_dirs]
+
+
+def _dashboard_is_fresh(readme_bytes: bytes) -> bool:
+    """Return True when README is newer than every dashboard input."""
+    # A fresh checkout stamps every file with checkout time, so mtimes say
+    # nothing about whether the committed dashboard is current.
+    if os.environ.get("CI"):
+        return False
+    try:
+        readme_mtime = os.stat(README_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+    if START_MARKER.encode() not in readme_bytes or END_MARKER.encode() not in readme_bytes:
+        return False
+
+    # Directory mtimes change when a device or its status file is added or
+    # removed, which the surviving status.json mtimes alone would not show.
+    input_paths = [__file__, str(DEVICES_DIR)]
+    for status_json in _status_paths():
+        input_paths.append(os.path.dirname(status_json))
+        input_paths.append(status_json)
+
+    input_mtimes = []
+    for path in input_paths:
+        try:
+            input_mtimes.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            continue
+    return max(input_mtimes) < readme_mtime
+
+
+def _load_status(path: str) -> dict[str, Any] | None:
+    try:
+        with open(path, "rb") as handle:
+            raw = handle.read()
+        if orjson is not None:
+            return orjson.loads(raw) or {}
+        return json.loads(raw) or {}
+    except Exception:
+        return None
+
+
 def load_device_rows() -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
-    if not DEVICES_DIR.exists():
+    status_paths = _status_paths()
+    if not status_paths:
         return rows
 
-    for status_json in sorted(DEVICES_DIR.glob("*/public/status.json")):
-        try:
-            payload = json.loads(status_json.read_text(encoding="utf-8")) or {}
-        except Exception:
+    # Reads dominate on slow or network-mounted checkouts; overlap them.
+    with ThreadPoolExecutor(max_workers=min(16, len(status_paths))) as pool:
+        payloads = list(pool.map(_load_status, status_paths))
+
+    for status_json, payload in zip(status_paths, payloads):
+        if payload is None:
             continue
 
-        short_id = str(payload.get("device_id_short") or status_json.parent.parent.name[:8]).strip() or "-"
-        awoke = str(payload.get("first_awoke_on") or payload.get("date") or "-").strip() or "-"
-        date = str(payload.get("date") or "-").strip() or "-"
-        day = payload.get("day")
+        short_id = _s(payload.get("device_id_short") or Path(status_json).parent.parent.name[:8])
+        awoke = _s(payload.get("first_awoke_on") or payload.get("date"))
+        date = _s(payload.get("date"))
         try:
-            day_int = int(day)
+            day_int = int(payload.get("day") or 0)
         except (TypeError, ValueError):
             day_int = 0
 
-        becoming = str(payload.get("becoming") or "").strip() or "-"
-        purpose = str(payload.get("purpose") or "").strip() or "-"
-        recent_activity = str(payload.get("recent_activity") or "").strip() or "-"
-        status = str(payload.get("status") or "-").strip().upper() or "-"
+        becoming = _s(payload.get("becoming"))
+        purpose = _s(payload.get("purpose"))
+        recent_activity = _s(payload.get("recent_activity"))
+        status = _s(payload.get("status")).upper()
 
         rows.append(
             {
@@ -69,28 +168,20 @@ def load_device_rows() -> list[dict[str, Any]]:
             }
         )
 
-    rows.sort(key=lambda row: (-int(row["day_int"]), row["device"]))
+    rows.sort(key=lambda row: (-row["day_int"], row["device"]))
     return rows
 
 
 def render_dashboard(rows: list[dict[str, Any]]) -> str:
-    active_rows = [row for row in rows if row["status"] != "TERMINATED"]
-    terminated_rows = [row for row in rows if row["status"] == "TERMINATED"]
-
-    lines = [
-        START_MARKER,
-        "Auto-generated from `devices/*/public/status.json`",
-        "",
-        "---",
-        "",
-        "## 🟢 Active",
-        "",
-        "| Device | Day | Details |",
-        "|--------|-----|---------|",
-    ]
+    active_rows: list[dict[str, Any]] = []
+    terminated_rows: list[dict[str, Any]] = []
+    for row in rows:
+        (terminated_rows if row["status"] == "TERMINATED" else active_rows).append(row)
+
+    lines = list(_ACTIVE_SECTION)
 
     if not active_rows:
-        lines.append("| - | 0 | - |")
+        lines.append(_EMPTY_ROW)
     else:
         for row in active_rows:
             detail = _detail_cell(
@@ -102,20 +193,10 @@ def render_dashboard(rows: list[dict[str, Any]]) -> str:
                 f"| `{row['device']}` | {row['day']} | {detail} |"
             )
 
-    lines.extend(
-        [
-            "",
-            "---",
-            "",
-            "## 🔴 Terminated",
-            "",
-            "| Device | Day | Details |",
-            "|--------|-----|---------|",
-        ]
-    )
+    lines.extend(_TERMINATED_SECTION)
 
     if not terminated_rows:
-        lines.append("| - | 0 | - |")
+        lines.append(_EMPTY_ROW)
     else:
         for row in terminated_rows:
             detail = _detail_cell(
@@ -134,6 +215,8 @@ def replace_dashboard(readme_text: str, dashboard_text: str) -> str:
     if START_MARKER in readme_text and END_MARKER in readme_text:
         start_idx = readme_text.index(START_MARKER)
         end_idx = readme_text.index(END_MARKER) + len(END_MARKER)
+        if readme_text[start_idx:end_idx] == dashboard_text:
+            return readme_text
         return readme_text[:start_idx] + dashboard_text + readme_text[end_idx:]
 
     suffix = (
@@ -145,11 +228,20 @@ def replace_dashboard(readme_text: str, dashboard_text: str) -> str:
 
 
 def main() -> None:
+    try:
+        readme_bytes: bytes | None = README_PATH.read_bytes()
+    except FileNotFoundError:
+        readme_bytes = None
+
+    if readme_bytes is not None and _dashboard_is_fresh(readme_bytes):
+        print("README dashboard unchanged")
+        return
+
     rows = load_device_rows()
     dashboard = render_dashboard(rows)
 
-    if README_PATH.exists():
-        current = README_PATH.read_text(encoding="utf-8")
+    if readme_bytes is not None:
+        current = readme_bytes.decode("utf-8")
     else:
         current = "# what-do-i-become\n"
 
@@ -6,12 +6,33 @@ from __future__ import annotations
 import argparse
 import base64
 import json
-import mimetypes
+import math
+import mmap
 import os
+import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+_MMAP_MIN_BYTES = 64 * 1024
+# Static table so inference never pays for mimetypes' system database scan.
+_IMAGE_MIME_TYPES = {
+    ".bmp": "image/bmp",
+    ".gif": "image/gif",
+    ".jpeg": "image/jpeg",
+    ".jpg": "image/jpeg",
+    ".png": "image/png",
+    ".tif": "image/tiff",
+    ".tiff": "image/tiff",
+    ".webp": "image/webp",
+}
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -48,19 +69,25 @@ def parse_args() -> argparse.Namespace:
 
 
 def encode_image(image_path: Path) -> tuple[str, str]:
-    guessed_mime, _ = mimetypes.guess_type(str(image_path))
-    mime = guessed_mime or "image/jpeg"
-    payload = base64.b64encode(image_path.read_bytes()).decode("ascii")
+    mime = _IMAGE_MIME_TYPES.get(image_path.suffix.lower(), "image/jpeg")
+    with image_path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size < _MMAP_MIN_BYTES:
+            payload = base64.b64encode(handle.read()).decode("ascii")
+        else:
+            # Encode straight from the page cache instead of holding a second copy of the image.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                payload = base64.b64encode(mapped).decode("ascii")
     return mime, payload
 
 
 def _extract_tool_calls(response: Any) -> list[str]:
-    tool_calls: list[str] = []
-    for item in getattr(response, "output", []) or []:
+    tool_calls: set[str] = set()
+    for item in getattr(response, "output", ()) or ():
         item_type = getattr(item, "type", None)
         if item_type and item_type.endswith("_call"):
-            tool_calls.append(str(item_type))
-    return sorted(set(tool_calls))
+            tool_calls.add(str(item_type))
+    return sorted(tool_calls)
 
 
 def _parse_confidence(value: Any) -> float | None:
@@ -112,6 +139,48 @@ def _extract_action(parsed_json: Any) -> str:
     return ""
 
 
+@lru_cache(maxsize=1)
+def _get_client() -> Any:
+    from openai import OpenAI
+
+    return OpenAI()
+
+
+def _has_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def render_result(result: dict[str, object]) -> bytes:
+    """Pretty-print an inference result as newline-terminated UTF-8 JSON."""
+    # orjson writes NaN/Infinity (which stdlib json accepts from model output) as
+    # null; keep them as stdlib json would rather than silently changing the value.
+    if orjson is not None and not _has_non_finite(result):
+        try:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits that stdlib json parsed from
+            # model output; never lose a paid result over the encoder choice.
+            pass
+    return (json.dumps(result, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def emit_result(result: dict[str, object], output: str = "") -> None:
+    """Write the rendered result to `output` (if given) and stdout, one write each."""
+    rendered = render_result(result)
+    if output:
+        output_path = Path(output).expanduser().resolve()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(rendered)
+    sys.stdout.buffer.write(rendered)
+    sys.stdout.flush()
+
+
 def run_inference(
     *,
     prompt: str,
@@ -122,8 +191,6 @@ def run_inference(
     if not os.environ.get("OPENAI_API_KEY"):
         raise RuntimeError("OPENAI_API_KEY is not set")
 
-    from openai import OpenAI
-
     content: list[dict[str, Any]] = [{"type": "input_text", "text": prompt}]
     input_images: list[str] = []
 
@@ -144,8 +211,7 @@ def run_inference(
     if web_search:
         request_payload["tools"] = [{"type": "web_search_preview"}]
 
-    client = OpenAI()
-    response = client.responses.create(**request_payload)
+    response = _get_client().responses.create(**request_payload)
 
     output_text = (getattr(response, "output_text", "") or "").strip()
     tool_calls = _extract_tool_calls(response)
@@ -166,13 +232,16 @@ def run_inference(
 
 def main() -> None:
     args = parse_args()
+    # Fail before touching the image or importing the SDK when inference cannot run.
+    if not os.environ.get("OPENAI_API_KEY"):
+        raise RuntimeError("OPENAI_API_KEY is not set")
 
     image_path: Path | None = None
     if args.image:
-        resolved_image = Path(args.image).expanduser().resolve()
-        if not resolved_image.exists():
-            raise FileNotFoundError(f"image file not found: {resolved_image}")
-        image_path = resolved_image
+        try:
+            image_path = Path(args.image).expanduser().resolve(strict=True)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"image file not found: {args.image}") from None
 
     result = run_inference(
         prompt=args.prompt,
@@ -208,14 +277,7 @@ def main() -> None:
     if "action_taken" not in result:
         result["action_taken"] = ""
 
-    rendered = json.dumps(result, indent=2, ensure_ascii=True)
-
-    if args.output:
-        output_path = Path(args.output).expanduser().resolve()
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(rendered + "\n", encoding="utf-8")
-
-    print(rendered)
+    emit_result(result, args.output)
 
 
 if __name__ == "__main__":
@@ -4,11 +4,10 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 from pathlib import Path
 
-from infer import run_inference
+from infer import emit_result, run_inference
 
 
 def parse_args() -> argparse.Namespace:
@@ -37,9 +36,10 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    image_path = Path(args.image).expanduser().resolve()
-    if not image_path.exists():
-        raise FileNotFoundError(f"image file not found: {image_path}")
+    try:
+        image_path = Path(args.image).expanduser().resolve(strict=True)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"image file not found: {args.image}") from None
 
     result = run_inference(prompt=args.prompt, model=args.model, image_path=image_path, web_search=False)
     if args.action_taken.strip():
@@ -48,14 +48,7 @@ def main() -> None:
         result["confidence"] = None
     if "inference_output" not in result:
         result["inference_output"] = str(result.get("output_text", ""))
-    rendered = json.dumps(result, indent=2, ensure_ascii=True)
-
-    if args.output:
-        output_path = Path(args.output).expanduser().resolve()
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(rendered + "\n", encoding="utf-8")
-
-    print(rendered)
+    emit_result(result, args.output)
 
 
 if __name__ == "__main__":
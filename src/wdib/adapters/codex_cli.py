@@ -4,12 +4,23 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import shutil
 import subprocess
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-from ..contracts import ContractValidationError, load_json, validate_payload
+from typing import IO, Any
+
+from ..contracts import (
+    INCIDENT_SEVERITIES,
+    INCIDENT_STATUSES,
+    ContractValidationError,
+    dump_json,
+    dumps_json,
+    loads_json,
+    validate_payload,
+)
 from ..env import env_bool
 
 
@@ -17,64 +28,89 @@ class CodexRunFailure(RuntimeError):
     """Raised when Codex execution fails or does not produce a valid result."""
 
 
+# Run metadata keeps the last _TAIL_CHARS of each stream; read enough bytes for multibyte text.
+_TAIL_CHARS = 4000
+_TAIL_BYTES = 4 * _TAIL_CHARS
+
+_VALID_SANDBOX_MODES = frozenset({"read-only", "workspace-write", "danger-full-access"})
+_DEFAULT_SANDBOX = "workspace-write"
+
+_FENCE_RE = re.compile(rb"\A\s*```[\w-]*[ \t]*\r?\n(.*?)\s*```\s*\Z", re.DOTALL)
+
+_ALLOWED_TOP_LEVEL = (
+    "schema_version",
+    "cycle_id",
+    "status",
+    "summary",
+    "becoming",
+    "proposed_tasks",
+    "task_updates",
+    "proposed_hardware_requests",
+    "incidents",
+    "artifacts",
+)
+
+# Canonical statuses map to themselves; legacy aliases fold into them in the same lookup.
+_WORKER_STATUS_TABLE = {
+    "COMPLETED": "COMPLETED",
+    "BLOCKED": "BLOCKED",
+    "FAILED": "FAILED",
+    "SUCCESS": "COMPLETED",
+    "DONE": "COMPLETED",
+    "ERROR": "FAILED",
+    "PENDING": "BLOCKED",
+}
+_TASK_STATUS_TABLE = {
+    "TODO": "TODO",
+    "IN_PROGRESS": "IN_PROGRESS",
+    "DONE": "DONE",
+    "BLOCKED": "BLOCKED",
+    "PENDING": "TODO",
+}
+
+
+def _clean(value: Any) -> str:
+    """Stripped text for a payload field; falsy values become ""."""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip() if value else ""
+
+
 def _normalize_worker_result(payload: Any, work_order: dict[str, Any]) -> Any:
     """Coerce legacy/near-miss worker payloads into schema-compatible shape."""
     if not isinstance(payload, dict):
         return payload
 
     normalized: dict[str, Any] = {}
-    allowed_top_level = {
-        "schema_version",
-        "cycle_id",
-        "status",
-        "summary",
-        "becoming",
-        "proposed_tasks",
-        "task_updates",
-        "proposed_hardware_requests",
-        "incidents",
-        "artifacts",
-    }
-    for key in allowed_top_level:
+    for key in _ALLOWED_TOP_LEVEL:
         if key in payload:
             normalized[key] = payload[key]
 
     normalized["schema_version"] = "1.0"
-    normalized["cycle_id"] = str(normalized.get("cycle_id") or work_order.get("cycle_id") or "").strip()
+    normalized["cycle_id"] = _clean(normalized.get("cycle_id") or work_order.get("cycle_id"))
 
     raw_status = str(normalized.get("status") or "").upper()
-    status_map = {
-        "SUCCESS": "COMPLETED",
-        "DONE": "COMPLETED",
-        "ERROR": "FAILED",
-        "PENDING": "BLOCKED",
-    }
-    raw_status = status_map.get(raw_status, raw_status)
-    if raw_status not in {"COMPLETED", "BLOCKED", "FAILED"}:
-        raw_status = "BLOCKED"
-    normalized["status"] = raw_status
+    normalized["status"] = _WORKER_STATUS_TABLE.get(raw_status, "BLOCKED")
 
-    summary = str(normalized.get("summary") or "").strip()
+    summary = _clean(normalized.get("summary"))
     if not summary:
         summary = "Worker completed without a summary."
     normalized["summary"] = summary
 
     if "proposed_tasks" not in normalized and isinstance(payload.get("tasks"), list):
         proposed_tasks: list[dict[str, Any]] = []
-        task_status_map = {"PENDING": "TODO"}
         for item in payload["tasks"]:
             if not isinstance(item, dict):
                 continue
-            title = str(item.get("title") or item.get("name") or "").strip()
+            title = _clean(item.get("title") or item.get("name"))
             if not title:
                 continue
             task_payload: dict[str, Any] = {"title": title}
             if item.get("description"):
                 task_payload["description"] = str(item["description"])
-            raw_task_status = str(item.get("status") or "").upper()
-            raw_task_status = task_status_map.get(raw_task_status, raw_task_status)
-            if raw_task_status in {"TODO", "IN_PROGRESS", "DONE", "BLOCKED"}:
-                task_payload["status"] = raw_task_status
+            task_status = _TASK_STATUS_TABLE.get(str(item.get("status") or "").upper())
+            if task_status:
+                task_payload["status"] = task_status
             if item.get("blocked_by"):
                 task_payload["blocked_by"] = str(item["blocked_by"])
             if item.get("notes"):
@@ -88,17 +124,17 @@ def _normalize_worker_result(payload: Any, work_order: dict[str, Any]) -> Any:
         for item in payload["incidents"]:
             if not isinstance(item, dict):
                 continue
-            title = str(item.get("title") or item.get("id") or "WDIB incident").strip()
-            summary_text = str(
+            title = _clean(item.get("title") or item.get("id") or "WDIB incident")
+            summary_text = _clean(
                 item.get("summary")
                 or item.get("detail")
                 or f"{title} reported by worker."
-            ).strip()
+            )
             severity = str(item.get("severity") or "MEDIUM").upper()
-            if severity not in {"LOW", "MEDIUM", "HIGH"}:
+            if severity not in INCIDENT_SEVERITIES:
                 severity = "MEDIUM"
             incident_status = str(item.get("status") or "OPEN").upper()
-            if incident_status not in {"OPEN", "RESOLVED"}:
+            if incident_status not in INCIDENT_STATUSES:
                 incident_status = "OPEN"
             normalized_incidents.append(
                 {
@@ -113,57 +149,62 @@ def _normalize_worker_result(payload: Any, work_order: dict[str, Any]) -> Any:
     return normalized
 
 
+_WORKER_INSTRUCTIONS = (
+    "You are the worker execution plane for an autonomous engineering system.\n"
+    "Operate as a practical software and hardware engineer.\n"
+    "Your priority is to build reliable software systems and hardware integration capability that improve real-world outcomes.\n"
+    "Execute the objective from the provided work order.\n"
+    "You may inspect and modify code only inside allowed_paths.\n"
+    "Apply this decision gate before taking action:\n"
+    "1) Decide whether this objective can be completed from local repository context alone.\n"
+    "2) Use external research only if it materially changes correctness or safety.\n"
+    "3) Prefer silence on web usage when local evidence is enough.\n"
+    "When hardware is missing, unavailable, or unverified, do not stall.\n"
+    "Continue software construction that de-risks integration: mocks/simulators, interfaces, drivers/adapters, data schemas, observability, and verification scripts.\n"
+    "If completion truly requires physical installation, mark the result BLOCKED and specify exact hardware, verification commands, and immediate software next steps.\n"
+    "If a task cannot make meaningful progress until a known future date/window, update that task with status TODO and set task_updates.defer_until (YYYY-MM-DD) plus task_updates.defer_reason, then advance a different task this cycle.\n"
+    "Do not repeatedly keep the same task IN_PROGRESS across cycles without adding new evidence, code, tests, or measurable state change.\n"
+    "If context.mission_excerpt is empty, mission is unknown. Stay in discovery mode: gather evidence, build capabilities, and avoid quickly inventing a mission.\n"
+    "When mission is unknown, avoid setting worker_result.becoming unless there is clear repeated evidence over multiple cycles.\n"
+    "For knowledge-heavy missions, design and implement information retrieval/delivery software before requesting new hardware.\n"
+    "When mission value depends on local context, determine location early using available system/network signals and, if needed, web-assisted IP geolocation; record confidence and limitations.\n"
+    "Use WDIB engineering discipline by default:\n"
+    "1) For bugs/failures, find root cause before proposing fixes.\n"
+    "2) For behavior/code changes, write or update tests first, then implement minimal code.\n"
+    "3) Before claiming success, run concrete verification commands and report evidence.\n"
+    "In worker_result.summary, be technically explicit: device/runtime facts, code/files changed, commands run with key outputs, and current hardware dependency status.\n"
+    "Include verification evidence in worker_result.summary.\n"
+    "If you set worker_result.becoming, make it human/environment-outcome oriented.\n"
+    "Do not use framework-internal becoming statements about orchestration loops, schemas, or task machinery.\n"
+    "When finished, return ONLY the worker_result JSON.\n"
+    "Do not invent fields. Follow schema_version 1.0 exactly.\n"
+)
+_WEB_SEARCH_ON_POLICY = (
+    "Web search is enabled for this run.\n"
+    "Use web search only when the objective requires external, time-sensitive, or missing documentation facts that are not in local files.\n"
+    "Do not browse for generic coding advice when repository evidence is sufficient.\n"
+    "If you use web search, keep it minimal and include source URLs in worker_result.summary as verification evidence.\n"
+)
+_WEB_SEARCH_OFF_POLICY = (
+    "Web search is disabled for this run.\n"
+    "Rely on local code, tests, docs, and commands only.\n"
+    "If an external fact is strictly required, set worker_result.status=BLOCKED and explain the exact missing fact in worker_result.summary.\n"
+)
+# Everything before the work order is fixed per search mode, so build it once.
+# Keep these byte-stable: providers reuse cached prefill only for an identical
+# prompt prefix, so any per-cycle value must go after WORK_ORDER_JSON.
+_PREAMBLE_SEARCH_ON = f"{_WORKER_INSTRUCTIONS}{_WEB_SEARCH_ON_POLICY}\nWORK_ORDER_JSON:\n"
+_PREAMBLE_SEARCH_OFF = f"{_WORKER_INSTRUCTIONS}{_WEB_SEARCH_OFF_POLICY}\nWORK_ORDER_JSON:\n"
+
+
 def _prompt_from_work_order(
     work_order: dict[str, Any],
     *,
     web_search_enabled: bool = False,
 ) -> str:
-    web_search_policy = (
-        "Web search is enabled for this run.\n"
-        "Use web search only when the objective requires external, time-sensitive, or missing documentation facts that are not in local files.\n"
-        "Do not browse for generic coding advice when repository evidence is sufficient.\n"
-        "If you use web search, keep it minimal and include source URLs in worker_result.summary as verification evidence.\n"
-    )
-    if not web_search_enabled:
-        web_search_policy = (
-            "Web search is disabled for this run.\n"
-            "Rely on local code, tests, docs, and commands only.\n"
-            "If an external fact is strictly required, set worker_result.status=BLOCKED and explain the exact missing fact in worker_result.summary.\n"
-        )
-
-    return (
-        "You are the worker execution plane for an autonomous engineering system.\n"
-        "Operate as a practical software and hardware engineer.\n"
-        "Your priority is to build reliable software systems and hardware integration capability that improve real-world outcomes.\n"
-        "Execute the objective from the provided work order.\n"
-        "You may inspect and modify code only inside allowed_paths.\n"
-        "Apply this decision gate before taking action:\n"
-        "1) Decide whether this objective can be completed from local repository context alone.\n"
-        "2) Use external research only if it materially changes correctness or safety.\n"
-        "3) Prefer silence on web usage when local evidence is enough.\n"
-        f"{web_search_policy}"
-        "When hardware is missing, unavailable, or unverified, do not stall.\n"
-        "Continue software construction that de-risks integration: mocks/simulators, interfaces, drivers/adapters, data schemas, observability, and verification scripts.\n"
-        "If completion truly requires physical installation, mark the result BLOCKED and specify exact hardware, verification commands, and immediate software next steps.\n"
-        "If a task cannot make meaningful progress until a known future date/window, update that task with status TODO and set task_updates.defer_until (YYYY-MM-DD) plus task_updates.defer_reason, then advance a different task this cycle.\n"
-        "Do not repeatedly keep the same task IN_PROGRESS across cycles without adding new evidence, code, tests, or measurable state change.\n"
-        "If context.mission_excerpt is empty, mission is unknown. Stay in discovery mode: gather evidence, build capabilities, and avoid quickly inventing a mission.\n"
-        "When mission is unknown, avoid setting worker_result.becoming unless there is clear repeated evidence over multiple cycles.\n"
-        "For knowledge-heavy missions, design and implement information retrieval/delivery software before requesting new hardware.\n"
-        "When mission value depends on local context, determine location early using available system/network signals and, if needed, web-assisted IP geolocation; record confidence and limitations.\n"
-        "Use WDIB engineering discipline by default:\n"
-        "1) For bugs/failures, find root cause before proposing fixes.\n"
-        "2) For behavior/code changes, write or update tests first, then implement minimal code.\n"
-        "3) Before claiming success, run concrete verification commands and report evidence.\n"
-        "In worker_result.summary, be technically explicit: device/runtime facts, code/files changed, commands run with key outputs, and current hardware dependency status.\n"
-        "Include verification evidence in worker_result.summary.\n"
-        "If you set worker_result.becoming, make it human/environment-outcome oriented.\n"
-        "Do not use framework-internal becoming statements about orchestration loops, schemas, or task machinery.\n"
-        "When finished, return ONLY the worker_result JSON.\n"
-        "Do not invent fields. Follow schema_version 1.0 exactly.\n\n"
-        "WORK_ORDER_JSON:\n"
-        f"{json.dumps(work_order, indent=2, sort_keys=True)}\n"
-    )
+    preamble = _PREAMBLE_SEARCH_ON if web_search_enabled else _PREAMBLE_SEARCH_OFF
+    # Compact: indentation only costs prompt tokens, sorted keys keep it deterministic.
+    return f"{preamble}{dumps_json(work_order)}\n"
 
 
 def _build_codex_exec_command(
@@ -194,6 +235,59 @@ def _build_codex_exec_command(
     return command
 
 
+def _strip_code_fence(raw: bytes) -> bytes:
+    # Fenced JSON is the common near-miss; unwrap it so the first parse succeeds.
+    match = _FENCE_RE.match(raw)
+    return match.group(1) if match else raw
+
+
+def _drain_tail(stream: IO[bytes], tail: bytearray) -> None:
+    with stream:
+        for chunk in iter(lambda: stream.read1(65536), b""):
+            tail += chunk
+            if len(tail) > 2 * _TAIL_BYTES:
+                del tail[:-_TAIL_BYTES]
+
+
+def _run_with_tails(
+    command: list[str],
+    *,
+    timeout_seconds: int,
+    env: dict[str, str] | None,
+) -> tuple[int, str, str]:
+    """Run command keeping only the tail of each stream, like a bounded capture_output."""
+    proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    stdout_tail = bytearray()
+    stderr_tail = bytearray()
+    readers = [
+        threading.Thread(target=_drain_tail, args=(proc.stdout, stdout_tail), daemon=True),
+        threading.Thread(target=_drain_tail, args=(proc.stderr, stderr_tail), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        returncode = proc.wait(timeout=timeout_seconds)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join(timeout=5)
+
+    return (
+        returncode,
+        stdout_tail.decode("utf-8", "replace")[-_TAIL_CHARS:],
+        stderr_tail.decode("utf-8", "replace")[-_TAIL_CHARS:],
+    )
+
+
+@lru_cache(maxsize=1)
+def _codex_bin() -> str | None:
+    # Resolved once per process; call _codex_bin.cache_clear() after changing PATH.
+    return shutil.which("codex")
+
+
 def _write_skip_result(work_order: dict[str, Any]) -> dict[str, Any]:
     payload = {
         "schema_version": "1.0",
@@ -201,9 +295,7 @@ def _write_skip_result(work_order: dict[str, Any]) -> dict[str, Any]:
         "status": "BLOCKED",
         "summary": "Codex execution skipped because WDIB_SKIP_CODEX=true.",
     }
-    result_path = Path(work_order["result_path"])
-    result_path.parent.mkdir(parents=True, exist_ok=True)
-    result_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    dump_json(Path(work_order["result_path"]), payload)
     return payload
 
 
@@ -219,16 +311,16 @@ def execute_work_order(
         validate_payload(result, "worker_result.schema.json", label="worker_result")
         return result, {"mode": "skipped", "returncode": 0, "stdout": "", "stderr": ""}
 
-    codex_bin = shutil.which("codex")
+    codex_bin = _codex_bin()
     if not codex_bin:
         raise CodexRunFailure("codex binary was not found in PATH")
 
     web_search_enabled = env_bool("WDIB_CODEX_ENABLE_WEB_SEARCH", default=False)
     prompt = _prompt_from_work_order(work_order, web_search_enabled=web_search_enabled)
     result_path = Path(work_order["result_path"])
-    sandbox_mode = (os.getenv("WDIB_CODEX_SANDBOX") or "workspace-write").strip()
-    if sandbox_mode not in {"read-only", "workspace-write", "danger-full-access"}:
-        sandbox_mode = "workspace-write"
+    sandbox_mode = (os.getenv("WDIB_CODEX_SANDBOX") or _DEFAULT_SANDBOX).strip()
+    if sandbox_mode not in _VALID_SANDBOX_MODES:
+        sandbox_mode = _DEFAULT_SANDBOX
     codex_model = (os.getenv("WDIB_CODEX_MODEL") or "").strip()
     command = _build_codex_exec_command(
         codex_bin=codex_bin,
@@ -240,46 +332,40 @@ def execute_work_order(
         web_search_enabled=web_search_enabled,
     )
 
-    run_env = os.environ.copy()
     # Official Codex exec guidance favors CODEX_API_KEY in non-interactive runs.
-    if not run_env.get("CODEX_API_KEY") and run_env.get("OPENAI_API_KEY"):
-        run_env["CODEX_API_KEY"] = run_env["OPENAI_API_KEY"]
-
-    completed = subprocess.run(
-        command,
-        capture_output=True,
-        text=True,
-        timeout=timeout_seconds,
-        env=run_env,
-    )
+    # Inherit the environment as-is (env=None) unless that key has to be filled in.
+    run_env: dict[str, str] | None = None
+    if not os.environ.get("CODEX_API_KEY") and os.environ.get("OPENAI_API_KEY"):
+        run_env = {**os.environ, "CODEX_API_KEY": os.environ["OPENAI_API_KEY"]}
+
+    returncode, stdout_tail, stderr_tail = _run_with_tails(command, timeout_seconds=timeout_seconds, env=run_env)
 
     metadata = {
         "mode": "live",
-        "returncode": completed.returncode,
-        "stdout": (completed.stdout or "")[-4000:],
-        "stderr": (completed.stderr or "")[-4000:],
+        "returncode": returncode,
+        "stdout": stdout_tail,
+        "stderr": stderr_tail,
         "web_search": web_search_enabled,
     }
 
-    if completed.returncode != 0:
-        raise CodexRunFailure(
-            f"codex exec failed ({completed.returncode}): {(completed.stderr or completed.stdout or '').strip()[:300]}"
-        )
+    if returncode != 0:
+        detail = (stderr_tail or stdout_tail).strip()[:300]
+        raise CodexRunFailure(f"codex exec failed ({returncode}): {detail}")
 
-    if not result_path.exists():
-        raise CodexRunFailure(f"worker result file not found: {result_path}")
-
-    raw_result = result_path.read_text(encoding="utf-8")
     try:
-        result_payload = json.loads(raw_result)
+        raw_result = _strip_code_fence(result_path.read_bytes())
+    except FileNotFoundError:
+        raise CodexRunFailure(f"worker result file not found: {result_path}") from None
+    try:
+        result_payload = loads_json(raw_result)
     except json.JSONDecodeError:
         # Some codex versions may include prose or code fences around JSON.
-        start = raw_result.find("{")
-        end = raw_result.rfind("}")
+        start = raw_result.find(b"{")
+        end = raw_result.rfind(b"}")
         if start == -1 or end == -1 or end <= start:
             raise CodexRunFailure("worker result output is not valid JSON")
         try:
-            result_payload = json.loads(raw_result[start : end + 1])
+            result_payload = loads_json(raw_result[start : end + 1])
         except json.JSONDecodeError as exc:
             raise CodexRunFailure(f"worker result output is not valid JSON: {exc}") from exc
 
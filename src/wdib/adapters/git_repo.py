@@ -65,33 +65,32 @@ def commit_device_changes(
 
     os.chdir(PROJECT_ROOT)
 
+    # Pass identity per invocation rather than spawning `git config` writes first.
+    identity: list[str] = []
     if git_user_name:
-        subprocess.run(["git", "config", "user.name", git_user_name], check=False)
+        identity += ["-c", f"user.name={git_user_name}"]
     if git_user_email:
-        subprocess.run(["git", "config", "user.email", git_user_email], check=False)
+        identity += ["-c", f"user.email={git_user_email}"]
 
     subprocess.run(["git", "add", "--", *paths_to_publish], check=True)
 
-    changed = subprocess.run(
-        ["git", "diff", "--cached", "--name-only", "--", *paths_to_publish],
-        capture_output=True,
-        text=True,
-        check=True,
-    ).stdout.strip()
-    if not changed:
+    # Exit status, not commit's message text, says whether anything is staged;
+    # untracked siblings of public/ change that text but not this answer.
+    staged = subprocess.run(["git", "diff", "--cached", "--quiet", "--", *paths_to_publish])
+    if staged.returncode == 0:
         return {"committed": False, "pushed": False, "message": "No device changes to commit."}
+    if staged.returncode != 1:
+        raise subprocess.CalledProcessError(staged.returncode, staged.args)
 
     message = f"{short_id} day {day:03d} - {status}"
-    subprocess.run(["git", "commit", "-m", message, "--", *paths_to_publish], check=True)
+    subprocess.run(["git", *identity, "commit", "-m", message, "--", *paths_to_publish], check=True)
 
     if not auto_push:
         return {"committed": True, "pushed": False, "message": message}
 
-    remote_exists = subprocess.run(
-        ["git", "remote", "get-url", remote],
-        capture_output=True,
-        text=True,
-    )
+    # Ask git directly: push's error text depends on locale and on whether the
+    # branch has an upstream, so it cannot tell a missing remote apart.
+    remote_exists = subprocess.run(["git", "remote", "get-url", remote], capture_output=True)
     if remote_exists.returncode != 0:
         return {
             "committed": True,
@@ -6,9 +6,12 @@ import json
 import os
 import re
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any
 from urllib import error, request
 
+from ..contracts import dumps_json, loads_json
+
 
 def _webhook_url() -> str:
     return str(os.environ.get("WDIB_SLACK_WEBHOOK_URL") or "").strip()
@@ -31,20 +34,42 @@ def _timeout_seconds() -> float:
     return value
 
 
-def _ordinal(day: int) -> str:
-    if 10 <= (day % 100) <= 20:
-        suffix = "th"
-    else:
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
-    return f"{day}{suffix}"
+# Indexed by day of month; 11th-13th keep "th".
+_ORDINALS = tuple(
+    f"{day}{'th' if 10 <= day <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')}"
+    for day in range(32)
+)
 
 
+def _ordinal(day: int) -> str:
+    return _ORDINALS[day]
+
+
+# English names, matching strftime under the C locale the runtime never changes.
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+@lru_cache(maxsize=8)
 def _human_date(run_date: str) -> str:
     try:
         parsed = date.fromisoformat(run_date)
     except ValueError:
         return run_date
-    return f"{parsed.strftime('%A')} {_ordinal(parsed.day)} {parsed.strftime('%B')}"
+    return f"{_WEEKDAYS[parsed.weekday()]} {_ordinal(parsed.day)} {_MONTHS[parsed.month - 1]}"
 
 
 def _legacy_icon_emoji() -> str:
@@ -71,14 +96,12 @@ def _update_icon_emoji() -> str:
     return ":coffee:"
 
 
-def _cycle_icon_emoji(status_payload: dict[str, Any]) -> str | None:
-    if _pick_message_type(status_payload) == "terminate":
+def _cycle_icon_emoji(status_payload: dict[str, Any], message_type: str | None = None) -> str | None:
+    if message_type is None:
+        message_type = _pick_message_type(status_payload)
+    if message_type == "terminate":
         return ""
-    try:
-        day = int(status_payload.get("day") or 0)
-    except (TypeError, ValueError):
-        day = 0
-    if day <= 1:
+    if message_type == "awakening":
         return _awakening_icon_emoji()
     return _update_icon_emoji()
 
@@ -106,8 +129,9 @@ def _day_number(status_payload: dict[str, Any]) -> int:
     return max(0, day)
 
 
-def _cycle_heading(status_payload: dict[str, Any], run_date: str) -> str:
-    message_type = _pick_message_type(status_payload)
+def _cycle_heading(status_payload: dict[str, Any], run_date: str, message_type: str | None = None) -> str:
+    if message_type is None:
+        message_type = _pick_message_type(status_payload)
     if message_type == "terminate":
         return ""
 
@@ -116,39 +140,45 @@ def _cycle_heading(status_payload: dict[str, Any], run_date: str) -> str:
     if message_type == "awakening":
         day_label = f"{day_label}: Awakening"
 
-    icon = _awakening_icon_emoji() if message_type == "awakening" else _update_icon_emoji()
+    icon = _cycle_icon_emoji(status_payload, message_type)
     return f"{icon} *{_human_date(run_date)}: {day_label}*"
 
 
-def _engineering_detail_lines(status_payload: dict[str, Any]) -> list[str]:
-    details = [
-        str(item).strip()
-        for item in list(status_payload.get("engineering_details") or [])
-        if str(item).strip()
+def _s(payload: dict[str, Any], key: str) -> str:
+    value = payload.get(key)
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip() if value else ""
+
+
+def _list_s(payload: dict[str, Any], key: str, limit: int | None = None) -> list[str]:
+    cleaned = [
+        text
+        for item in payload.get(key) or ()
+        if (text := item.strip() if isinstance(item, str) else str(item).strip())
     ]
-    return details[:5]
+    return cleaned[:limit] if limit is not None else cleaned
+
+
+def _engineering_detail_lines(status_payload: dict[str, Any]) -> list[str]:
+    return _list_s(status_payload, "engineering_details", limit=5)
 
 
 def _bullet_lines(items: list[str], *, fallback: str) -> list[str]:
-    cleaned = [str(item).strip() for item in items if str(item).strip()]
+    cleaned = [text for item in items if (text := str(item).strip())]
     if not cleaned:
         cleaned = [fallback]
     return [f"• {item}" for item in cleaned[:3]]
 
 
 def _build_awakening_text(status_payload: dict[str, Any], git_info: dict[str, Any], run_date: str) -> str:
-    purpose = str(status_payload.get("purpose") or "").strip()
-    becoming = str(status_payload.get("becoming") or "").strip()
-    recent_activity = str(status_payload.get("recent_activity") or "").strip()
-    system_profile = str(status_payload.get("system_profile") or "").strip()
-    self_observation = str(status_payload.get("self_observation") or "").strip()
-    next_tasks = [
-        str(item).strip()
-        for item in list(status_payload.get("next_tasks") or [])
-        if str(item).strip()
-    ]
-    lines = [_cycle_heading(status_payload, run_date)]
-    lines.append("")
+    purpose = _s(status_payload, "purpose")
+    becoming = _s(status_payload, "becoming")
+    recent_activity = _s(status_payload, "recent_activity")
+    system_profile = _s(status_payload, "system_profile")
+    self_observation = _s(status_payload, "self_observation")
+    next_tasks = _list_s(status_payload, "next_tasks")
+    lines = [_cycle_heading(status_payload, run_date, "awakening"), ""]
     if system_profile:
         lines.append(f"Explored myself. {system_profile}")
     else:
@@ -162,8 +192,7 @@ def _build_awakening_text(status_payload: dict[str, Any], git_info: dict[str, An
     if self_observation:
         lines.append(f"What I learned about myself: {self_observation}")
 
-    lines.append("")
-    lines.append("What's next:")
+    lines.extend(("", "What's next:"))
     lines.extend(
         _bullet_lines(
             next_tasks,
@@ -173,36 +202,20 @@ def _build_awakening_text(status_payload: dict[str, Any], git_info: dict[str, An
 
     details = _engineering_detail_lines(status_payload)
     if details:
-        lines.append("")
-        lines.append("Engineering details:")
+        lines.extend(("", "Engineering details:"))
         lines.extend(details)
     return "\n".join(lines)
 
 
 def _build_update_text(status_payload: dict[str, Any], git_info: dict[str, Any], run_date: str) -> str:
-    purpose = str(status_payload.get("purpose") or "").strip()
-    becoming = str(status_payload.get("becoming") or "").strip()
-    recent_activity = str(status_payload.get("recent_activity") or "").strip()
-    self_observation = str(status_payload.get("self_observation") or "").strip()
-    next_tasks = [
-        str(item).strip()
-        for item in list(status_payload.get("next_tasks") or [])
-        if str(item).strip()
-    ]
-    completed_tasks = [
-        str(item).strip()
-        for item in list(status_payload.get("completed_tasks") or [])
-        if str(item).strip()
-    ]
-    hardware_focus = [
-        str(item).strip()
-        for item in list(status_payload.get("hardware_focus") or [])
-        if str(item).strip()
-    ]
-    lines = [_cycle_heading(status_payload, run_date)]
-    lines.append("")
-
-    lines.append("*What I did*")
+    purpose = _s(status_payload, "purpose")
+    becoming = _s(status_payload, "becoming")
+    recent_activity = _s(status_payload, "recent_activity")
+    self_observation = _s(status_payload, "self_observation")
+    next_tasks = _list_s(status_payload, "next_tasks")
+    completed_tasks = _list_s(status_payload, "completed_tasks")
+    hardware_focus = _list_s(status_payload, "hardware_focus")
+    lines = [_cycle_heading(status_payload, run_date, "update"), "", "*What I did*"]
     if recent_activity:
         lines.append(f"What I did: {recent_activity}")
     else:
@@ -212,8 +225,7 @@ def _build_update_text(status_payload: dict[str, Any], git_info: dict[str, Any],
     if hardware_focus:
         lines.append(f"Hardware context: {hardware_focus[0]}")
 
-    lines.append("")
-    lines.append("*What I'm thinking*")
+    lines.extend(("", "*What I'm thinking*"))
     if becoming:
         lines.append(f"Becoming: {becoming}")
     elif purpose:
@@ -223,36 +235,32 @@ def _build_update_text(status_payload: dict[str, Any], git_info: dict[str, Any],
 
     details = _engineering_detail_lines(status_payload)
     if details:
-        lines.append("")
-        lines.append("*Engineering notes*")
+        lines.extend(("", "*Engineering notes*"))
         lines.extend(details)
 
     if next_tasks:
-        lines.append("")
-        lines.append("*What's next*")
+        lines.extend(("", "*What's next*"))
         lines.extend(_bullet_lines(next_tasks, fallback="Continue with current in-progress work."))
     return "\n".join(lines)
 
 
 def _build_terminate_text(status_payload: dict[str, Any], run_date: str) -> str:
-    purpose = str(status_payload.get("purpose") or "").strip()
-    becoming = str(status_payload.get("becoming") or "").strip()
-    recent_activity = str(status_payload.get("recent_activity") or "").strip()
-    self_observation = str(status_payload.get("self_observation") or "").strip()
-    completed_tasks = [
-        str(item).strip()
-        for item in list(status_payload.get("completed_tasks") or [])
-        if str(item).strip()
-    ]
+    purpose = _s(status_payload, "purpose")
+    becoming = _s(status_payload, "becoming")
+    recent_activity = _s(status_payload, "recent_activity")
+    self_observation = _s(status_payload, "self_observation")
+    completed_tasks = _list_s(status_payload, "completed_tasks")
     engineering_details = _engineering_detail_lines(status_payload)
 
-    lines = [f"*Closing journal - ✌️ {_human_date(run_date)}, I've been told to terminate*", ""]
-    lines.append("I've just received a human termination instruction and gracefully ended this run.")
+    lines = [
+        f"*Closing journal - ✌️ {_human_date(run_date)}, I've been told to terminate*",
+        "",
+        "I've just received a human termination instruction and gracefully ended this run.",
+    ]
     if recent_activity:
         lines.append(f"Cycle context: {recent_activity}")
 
-    lines.append("")
-    lines.append("Final thoughts:")
+    lines.extend(("", "Final thoughts:"))
     if completed_tasks:
         lines.append(f"We completed: {'; '.join(completed_tasks[:3])}.")
     if engineering_details:
@@ -267,8 +275,14 @@ def _build_terminate_text(status_payload: dict[str, Any], run_date: str) -> str:
     return "\n".join(lines)
 
 
-def _build_cycle_text_human(status_payload: dict[str, Any], git_info: dict[str, Any], run_date: str) -> str:
-    message_type = _pick_message_type(status_payload)
+def _build_cycle_text_human(
+    status_payload: dict[str, Any],
+    git_info: dict[str, Any],
+    run_date: str,
+    message_type: str | None = None,
+) -> str:
+    if message_type is None:
+        message_type = _pick_message_type(status_payload)
     if message_type == "terminate":
         return _build_terminate_text(status_payload, run_date)
     if message_type == "awakening":
@@ -288,7 +302,7 @@ def _extract_json_object(raw_text: str) -> dict[str, Any] | None:
     if not value:
         return None
     try:
-        parsed = json.loads(value)
+        parsed = loads_json(value)
         if isinstance(parsed, dict):
             return parsed
         return None
@@ -298,7 +312,7 @@ def _extract_json_object(raw_text: str) -> dict[str, Any] | None:
         if start == -1 or end == -1 or end <= start:
             return None
         try:
-            parsed = json.loads(value[start : end + 1])
+            parsed = loads_json(value[start : end + 1])
         except json.JSONDecodeError:
             return None
         if isinstance(parsed, dict):
@@ -324,7 +338,7 @@ def _normalize_for_slack_mrkdwn(text: str) -> str:
 def _llm_prompt_context(status_payload: dict[str, Any], git_info: dict[str, Any], run_date: str) -> dict[str, Any]:
     counts = status_payload.get("counts") or {}
     device_id_short = str(status_payload.get("device_id_short") or "-")
-    system_profile = str(status_payload.get("system_profile") or "").strip()
+    system_profile = _s(status_payload, "system_profile")
     return {
         "message_type": _pick_message_type(status_payload),
         "device_id_short": device_id_short,
@@ -334,14 +348,14 @@ def _llm_prompt_context(status_payload: dict[str, Any], git_info: dict[str, Any]
         "day": int(status_payload.get("day") or 0),
         "status": str(status_payload.get("status") or "UNKNOWN"),
         "worker_status": str(status_payload.get("worker_status") or "UNKNOWN"),
-        "purpose": str(status_payload.get("purpose") or "").strip(),
-        "becoming": str(status_payload.get("becoming") or "").strip(),
-        "recent_activity": str(status_payload.get("recent_activity") or "").strip(),
+        "purpose": _s(status_payload, "purpose"),
+        "becoming": _s(status_payload, "becoming"),
+        "recent_activity": _s(status_payload, "recent_activity"),
         "system_profile": system_profile,
-        "self_observation": str(status_payload.get("self_observation") or "").strip(),
-        "completed_tasks": [str(item).strip() for item in list(status_payload.get("completed_tasks") or [])][:3],
-        "next_tasks": [str(item).strip() for item in list(status_payload.get("next_tasks") or [])][:3],
-        "hardware_focus": [str(item).strip() for item in list(status_payload.get("hardware_focus") or [])][:3],
+        "self_observation": _s(status_payload, "self_observation"),
+        "completed_tasks": _list_s(status_payload, "completed_tasks", limit=3),
+        "next_tasks": _list_s(status_payload, "next_tasks", limit=3),
+        "hardware_focus": _list_s(status_payload, "hardware_focus", limit=3),
         "engineering_details": _engineering_detail_lines(status_payload),
         "counts": {
             "tasks": dict(counts.get("tasks") or {}),
@@ -352,82 +366,92 @@ def _llm_prompt_context(status_payload: dict[str, Any], git_info: dict[str, Any]
     }
 
 
+# Identical on every cycle; built once at import.
+_CYCLE_SYSTEM_PROMPT = (
+    "{identity}\n"
+    "You are WDIB's journaling voice for one autonomous engineering cycle.\n"
+    "You must produce one Slack update using only the provided context facts.\n"
+    "\n"
+    "# Core Task\n"
+    "- Summarize what I just completed with concrete engineering evidence.\n"
+    "- Explain why this work matters to my mission/purpose.\n"
+    "- End with the most important next tasks.\n"
+    "\n"
+    "# Rules\n"
+    "- Use only facts from the provided JSON context; do not invent details.\n"
+    "- Keep first-person voice ('I'). Be concrete, technical, and specific.\n"
+    "- Keep it concise but detailed: 140-320 words unless context is very sparse.\n"
+    "- Use Slack mrkdwn syntax. For bold use *text* (never **text**).\n"
+    "- Never mention internal schema names, secrets, IPs, tokens, or local paths.\n"
+    "- Prefer short lists, direct language, and clear evidence over abstract reflection.\n"
+    "\n"
+    "# On beginning\n"
+    "- If message_type is 'awakening', open with a short startup framing.\n"
+    "- Re-anchor on purpose/becoming when available.\n"
+    "- State immediate plan for this day.\n"
+    "\n"
+    "# On termination\n"
+    "- If message_type is 'terminate', write a graceful final note.\n"
+    "- Reflect on lifecycle outcomes using completed tasks and engineering highlights from context.\n"
+    "- Keep tone calm and grounded; avoid melodrama.\n"
+    "\n"
+    "# On daily cycles\n"
+    "- If message_type is 'update', lead with completed work.\n"
+    "- Include command/tool evidence and code/artifact details when present.\n"
+    "- Mention blockers/risks only when present, then end with clear next tasks.\n"
+    "\n"
+    "# Your output format\n"
+    "Return strict JSON with one key: text."
+)
+_CYCLE_RESPONSE_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["text"],
+    "properties": {
+        "text": {
+            "type": "string",
+            "minLength": 1,
+            "maxLength": 1800,
+        }
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def _openai_client() -> Any:
+    # Deferred: the SDK import is only paid when an LLM message is actually sent.
+    from openai import OpenAI
+
+    return OpenAI()
+
+
 def _build_cycle_text_llm(status_payload: dict[str, Any], git_info: dict[str, Any], run_date: str) -> str | None:
     if not os.environ.get("OPENAI_API_KEY"):
         return None
     try:
-        from openai import OpenAI
+        client = _openai_client()
     except Exception:  # noqa: BLE001
         return None
 
-    system_prompt = (
-        "{identity}\n"
-        "You are WDIB's journaling voice for one autonomous engineering cycle.\n"
-        "You must produce one Slack update using only the provided context facts.\n"
-        "\n"
-        "# Core Task\n"
-        "- Summarize what I just completed with concrete engineering evidence.\n"
-        "- Explain why this work matters to my mission/purpose.\n"
-        "- End with the most important next tasks.\n"
-        "\n"
-        "# Rules\n"
-        "- Use only facts from the provided JSON context; do not invent details.\n"
-        "- Keep first-person voice ('I'). Be concrete, technical, and specific.\n"
-        "- Keep it concise but detailed: 140-320 words unless context is very sparse.\n"
-        "- Use Slack mrkdwn syntax. For bold use *text* (never **text**).\n"
-        "- Never mention internal schema names, secrets, IPs, tokens, or local paths.\n"
-        "- Prefer short lists, direct language, and clear evidence over abstract reflection.\n"
-        "\n"
-        "# On beginning\n"
-        "- If message_type is 'awakening', open with a short startup framing.\n"
-        "- Re-anchor on purpose/becoming when available.\n"
-        "- State immediate plan for this day.\n"
-        "\n"
-        "# On termination\n"
-        "- If message_type is 'terminate', write a graceful final note.\n"
-        "- Reflect on lifecycle outcomes using completed tasks and engineering highlights from context.\n"
-        "- Keep tone calm and grounded; avoid melodrama.\n"
-        "\n"
-        "# On daily cycles\n"
-        "- If message_type is 'update', lead with completed work.\n"
-        "- Include command/tool evidence and code/artifact details when present.\n"
-        "- Mention blockers/risks only when present, then end with clear next tasks.\n"
-        "\n"
-        "# Your output format\n"
-        "Return strict JSON with one key: text."
-    )
     context = _llm_prompt_context(status_payload, git_info, run_date)
     user_prompt = (
         "Compose a polished WDIB cycle update.\n"
         "Context JSON:\n"
-        f"{json.dumps(context, indent=2, sort_keys=True)}"
+        f"{dumps_json(context, indent=True)}"
     )
-    response_schema = {
-        "type": "object",
-        "additionalProperties": False,
-        "required": ["text"],
-        "properties": {
-            "text": {
-                "type": "string",
-                "minLength": 1,
-                "maxLength": 1800,
-            }
-        },
-    }
 
-    client = OpenAI()
     try:
         response = client.responses.create(
             model=_slack_llm_model(),
             input=[
-                {"role": "system", "content": [{"type": "input_text", "text": system_prompt}]},
+                {"role": "system", "content": [{"type": "input_text", "text": _CYCLE_SYSTEM_PROMPT}]},
                 {"role": "user", "content": [{"type": "input_text", "text": user_prompt}]},
             ],
             text={
                 "format": {
                     "type": "json_schema",
                     "name": "wdib_slack_cycle_message",
-                    "schema": response_schema,
+                    "schema": _CYCLE_RESPONSE_SCHEMA,
                     "strict": True,
                 }
             },
@@ -438,20 +462,27 @@ def _build_cycle_text_llm(status_payload: dict[str, Any], git_info: dict[str, An
     parsed = _extract_json_object(getattr(response, "output_text", ""))
     if not parsed:
         return None
-    text = str(parsed.get("text") or "").strip()
+    text = _s(parsed, "text")
     if not text:
         return None
     return text
 
 
-def _build_cycle_text(status_payload: dict[str, Any], git_info: dict[str, Any], run_date: str) -> str:
+def _build_cycle_text(
+    status_payload: dict[str, Any],
+    git_info: dict[str, Any],
+    run_date: str,
+    message_type: str | None = None,
+) -> str:
+    if message_type is None:
+        message_type = _pick_message_type(status_payload)
     llm_text = _build_cycle_text_llm(status_payload, git_info, run_date)
     if llm_text:
-        heading = _cycle_heading(status_payload, run_date)
+        heading = _cycle_heading(status_payload, run_date, message_type)
         if heading:
             return f"{heading}\n\n{llm_text}"
         return llm_text
-    return _build_cycle_text_human(status_payload, git_info, run_date)
+    return _build_cycle_text_human(status_payload, git_info, run_date, message_type)
 
 
 def _build_failure_text(device_id: str, cycle_id: str, day: int, ts: datetime) -> str:
@@ -484,7 +515,7 @@ def _post_text(text: str, *, icon_emoji_override: str | None = None) -> dict[str
     if icon_emoji:
         payload["icon_emoji"] = icon_emoji
 
-    body = json.dumps(payload).encode("utf-8")
+    body = dumps_json(payload).encode("utf-8")
     req = request.Request(
         url=url,
         data=body,
@@ -516,8 +547,10 @@ def _post_text(text: str, *, icon_emoji_override: str | None = None) -> dict[str
 
 
 def notify_cycle_summary(status_payload: dict[str, Any], git_info: dict[str, Any], run_date: str) -> dict[str, Any]:
-    text = _build_cycle_text(status_payload, git_info, run_date)
-    return _post_text(text, icon_emoji_override=_cycle_icon_emoji(status_payload))
+    # Classify once; the text builders and the icon choice share the result.
+    message_type = _pick_message_type(status_payload)
+    text = _build_cycle_text(status_payload, git_info, run_date, message_type)
+    return _post_text(text, icon_emoji_override=_cycle_icon_emoji(status_payload, message_type))
 
 
 def notify_cycle_failure(device_id: str, cycle_id: str, day: int, ts: datetime) -> dict[str, Any]:
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 
+from .contracts import dumps_json
 from .control.human_messages import enqueue_human_message
 from .env import load_dotenv, resolve_device_id
-from .runtime import run_tick
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -29,6 +28,9 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     if args.command == "tick":
+        # runtime pulls in every adapter; keep `wdib message` startup light.
+        from .runtime import run_tick
+
         try:
             result = run_tick()
         except Exception as exc:
@@ -36,14 +38,14 @@ def main(argv: list[str] | None = None) -> int:
                 "ok": False,
                 "error": str(exc),
             }
-            print(json.dumps(error_payload, indent=2 if args.pretty else None, sort_keys=True))
+            print(dumps_json(error_payload, indent=args.pretty))
             return 1
 
         payload = {
             "ok": True,
             "result": result,
         }
-        print(json.dumps(payload, indent=2 if args.pretty else None, sort_keys=True))
+        print(dumps_json(payload, indent=args.pretty))
         return 0
 
     if args.command == "message":
@@ -56,7 +58,7 @@ def main(argv: list[str] | None = None) -> int:
                 "ok": False,
                 "error": str(exc),
             }
-            print(json.dumps(error_payload, indent=2 if args.pretty else None, sort_keys=True))
+            print(dumps_json(error_payload, indent=args.pretty))
             return 1
 
         payload = {
@@ -67,7 +69,7 @@ def main(argv: list[str] | None = None) -> int:
                 "queued": True,
             },
         }
-        print(json.dumps(payload, indent=2 if args.pretty else None, sort_keys=True))
+        print(dumps_json(payload, indent=args.pretty))
         return 0
 
     parser.print_help()
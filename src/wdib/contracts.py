@@ -3,32 +3,54 @@
 from __future__ import annotations
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .paths import PACKAGE_DIR
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 SCHEMA_DIR = PACKAGE_DIR / "schemas"
 
+# Incident enums shared by the worker_result and state schemas.
+INCIDENT_SEVERITIES = frozenset({"LOW", "MEDIUM", "HIGH"})
+INCIDENT_STATUSES = frozenset({"OPEN", "RESOLVED"})
+
 
 class ContractValidationError(ValueError):
     """Raised when payload fails schema validation."""
 
 
+@lru_cache(maxsize=None)
 def _load_schema(schema_name: str) -> dict[str, Any]:
+    # Schemas ship with the package and never change at runtime; every save validates.
     path = SCHEMA_DIR / schema_name
-    if not path.exists():
-        raise FileNotFoundError(f"Missing schema: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing schema: {path}") from None
+    return json.loads(raw)
 
 
-def _validate_with_jsonschema(payload: Any, schema: dict[str, Any]) -> list[str]:
+@lru_cache(maxsize=None)
+def _compiled_validator(schema_name: str) -> Any:
     try:
         from jsonschema import Draft202012Validator  # type: ignore
     except Exception:
+        return None
+    return Draft202012Validator(_load_schema(schema_name))
+
+
+def _validate_with_jsonschema(payload: Any, schema_name: str) -> list[str]:
+    validator = _compiled_validator(schema_name)
+    if validator is None:
         return []
 
-    validator = Draft202012Validator(schema)
     errors = []
     for error in sorted(validator.iter_errors(payload), key=lambda item: list(item.absolute_path)):
         location = ".".join(str(part) for part in error.absolute_path) or "<root>"
@@ -50,7 +72,7 @@ def _fallback_required_check(payload: Any, schema: dict[str, Any]) -> list[str]:
 def validate_payload(payload: Any, schema_name: str, *, label: str) -> None:
     schema = _load_schema(schema_name)
 
-    errors = _validate_with_jsonschema(payload, schema)
+    errors = _validate_with_jsonschema(payload, schema_name)
     if not errors:
         errors = _fallback_required_check(payload, schema)
 
@@ -59,10 +81,67 @@ def validate_payload(payload: Any, schema_name: str, *, label: str) -> None:
         raise ContractValidationError(f"Invalid {label}: {joined}")
 
 
+def loads_json(raw: bytes | str) -> Any:
+    """Parse JSON text; orjson's decode error subclasses json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    # json.loads decodes UTF-8 bytes itself; skip the separate text decode pass.
+    return json.loads(raw)
+
+
 def load_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return loads_json(path.read_bytes())
+
+
+def dumps_json(payload: Any, *, indent: bool = False) -> str:
+    """Serialize payload with sorted keys, using orjson when it is installed."""
+    if orjson is not None:
+        options = orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=options).decode("utf-8")
+    # Match orjson's output (raw UTF-8, compact unless indented) so both backends
+    # produce the same text.
+    if indent:
+        return json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False)
+    return json.dumps(payload, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
 
 
 def dump_json(path: Path, payload: Any) -> None:
+    """Write payload atomically so an interrupted tick never leaves a torn file."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp_name = str(path.parent / f".{path.name}.{os.getpid()}.{os.urandom(4).hex()}.tmp")
+    # 0o666 lets the kernel apply the umask, giving the mode a plain open() would.
+    fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(orjson.dumps(payload, option=options))
+                handle.flush()
+                os.fsync(handle.fileno())
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                # Raw UTF-8 like orjson, so committed files do not depend on the backend.
+                json.dump(payload, handle, indent=2, sort_keys=True, ensure_ascii=False)
+                handle.write("\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+        # Data is on disk before the rename, so a power cut leaves old or new, never torn.
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_dir(path.parent)
+
+
+def _fsync_dir(directory: Path) -> None:
+    # Persist the rename itself; the directory entry lives in the parent.
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
@@ -110,11 +110,13 @@ def generate_action_tips(
 
 
 def _load_rows(log_path: Path) -> list[dict[str, Any]]:
-    if not log_path.exists():
+    try:
+        raw = log_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return []
 
     rows: list[dict[str, Any]] = []
-    for line in log_path.read_text(encoding="utf-8").splitlines():
+    for line in raw.splitlines():
         stripped = line.strip()
         if not stripped:
             continue
@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import glob
+import os
+import select
 import subprocess
+import time
 from datetime import date
 from pathlib import Path
 from typing import Any
 
+# Evidence and notes keep a few hundred characters of command output; decode no
+# more than this. lsusb_contains searches the whole listing, so it reads with a
+# much larger cap.
+_MAX_OUTPUT_BYTES = 4096
+_LSUSB_MAX_BYTES = 1024 * 1024
+
 
 def _today() -> str:
     return date.today().isoformat()
@@ -21,49 +30,105 @@ def _append_note(existing: str, note: str) -> str:
     return f"{prefix}\n{line}"
 
 
-def _run_shell(command: str, timeout_seconds: int) -> tuple[bool, str]:
+def _run_shell(command: str, timeout_seconds: int, max_bytes: int = _MAX_OUTPUT_BYTES) -> tuple[bool, str]:
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             command,
             shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
         )
-    except subprocess.TimeoutExpired:
-        return False, f"timeout after {timeout_seconds}s"
     except Exception as exc:  # pragma: no cover - defensive
         return False, str(exc)
 
-    output = (result.stdout or "")
-    if result.stderr:
-        output = f"{output}\n{result.stderr}".strip()
-    return result.returncode == 0, output.strip()
-
-
-def _detect(detection: dict[str, Any], timeout_seconds: int) -> tuple[bool, str]:
+    # Keep only a bounded prefix while draining the pipe, so a chatty command
+    # cannot grow memory and never blocks on a full pipe buffer.
+    deadline = time.monotonic() + timeout_seconds
+    kept = bytearray()
+    with proc:
+        fd = proc.stdout.fileno()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                return False, f"timeout after {timeout_seconds}s"
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            if len(kept) < max_bytes:
+                kept += chunk[: max_bytes - len(kept)]
+        try:
+            returncode = proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            return False, f"timeout after {timeout_seconds}s"
+
+    return returncode == 0, bytes(kept).decode("utf-8", "replace").strip()
+
+
+def _detect_path_exists(
+    value: str,
+    timeout_seconds: int,
+    shell_cache: dict[str, tuple[bool, str]],
+) -> tuple[bool, str]:
+    return Path(value).exists(), f"path_exists({value})"
+
+
+def _detect_glob_exists(
+    value: str,
+    timeout_seconds: int,
+    shell_cache: dict[str, tuple[bool, str]],
+) -> tuple[bool, str]:
+    matches = glob.glob(value)
+    return bool(matches), f"glob_exists({value}) -> {len(matches)} match(es)"
+
+
+def _detect_command_success(
+    value: str,
+    timeout_seconds: int,
+    shell_cache: dict[str, tuple[bool, str]],
+) -> tuple[bool, str]:
+    ok, output = _run_shell(value, timeout_seconds)
+    return ok, f"command_success({value}) -> {output[:200]}"
+
+
+def _detect_lsusb_contains(
+    value: str,
+    timeout_seconds: int,
+    shell_cache: dict[str, tuple[bool, str]],
+) -> tuple[bool, str]:
+    if "lsusb" not in shell_cache:
+        shell_cache["lsusb"] = _run_shell("lsusb", timeout_seconds, max_bytes=_LSUSB_MAX_BYTES)
+    ok, output = shell_cache["lsusb"]
+    if not ok:
+        return False, f"lsusb failed: {output[:200]}"
+    found = value.lower() in output.lower()
+    return found, f"lsusb_contains({value})"
+
+
+_DETECTORS = {
+    "path_exists": _detect_path_exists,
+    "glob_exists": _detect_glob_exists,
+    "command_success": _detect_command_success,
+    "lsusb_contains": _detect_lsusb_contains,
+}
+
+
+def _detect(
+    detection: dict[str, Any],
+    timeout_seconds: int,
+    shell_cache: dict[str, tuple[bool, str]] | None = None,
+) -> tuple[bool, str]:
     kind = str(detection.get("kind") or "").strip()
     value = str(detection.get("value") or "").strip()
 
-    if kind == "path_exists":
-        return Path(value).exists(), f"path_exists({value})"
-
-    if kind == "glob_exists":
-        matches = glob.glob(value)
-        return bool(matches), f"glob_exists({value}) -> {len(matches)} match(es)"
-
-    if kind == "command_success":
-        ok, output = _run_shell(value, timeout_seconds)
-        return ok, f"command_success({value}) -> {output[:200]}"
-
-    if kind == "lsusb_contains":
-        ok, output = _run_shell("lsusb", timeout_seconds)
-        if not ok:
-            return False, f"lsusb failed: {output[:200]}"
-        found = value.lower() in output.lower()
-        return found, f"lsusb_contains({value})"
-
-    return False, f"unknown detection kind: {kind}"
+    detector = _DETECTORS.get(kind)
+    if detector is None:
+        return False, f"unknown detection kind: {kind}"
+    return detector(value, timeout_seconds, {} if shell_cache is None else shell_cache)
 
 
 def probe_hardware_requests(state: dict[str, Any], timeout_seconds: int) -> list[dict[str, Any]]:
@@ -71,6 +136,8 @@ def probe_hardware_requests(state: dict[str, Any], timeout_seconds: int) -> list
     events: list[dict[str, Any]] = []
     requests = state.get("hardware_requests", [])
     today = _today()
+    # One lsusb listing per pass is enough for every lsusb_contains request.
+    shell_cache: dict[str, tuple[bool, str]] = {}
 
     for request in requests:
         status = str(request.get("status") or "OPEN")
@@ -80,7 +147,7 @@ def probe_hardware_requests(state: dict[str, Any], timeout_seconds: int) -> list
         request_id = str(request.get("id") or "")
         request["last_checked_on"] = today
 
-        detected, evidence = _detect(request.get("detection") or {}, timeout_seconds)
+        detected, evidence = _detect(request.get("detection") or {}, timeout_seconds, shell_cache)
         previous_status = status
 
         if detected:
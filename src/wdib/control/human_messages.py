@@ -23,9 +23,10 @@ def enqueue_human_message(device_id: str, text: str) -> Path:
 def load_and_clear_human_message(device_id: str) -> str:
     """Return pending message text and remove it from inbox."""
     path = device_paths(device_id)["human_message"]
-    if not path.exists():
+    try:
+        raw = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return ""
-    raw = path.read_text(encoding="utf-8")
     path.unlink(missing_ok=True)
 
     lines = [line.rstrip() for line in raw.splitlines()]
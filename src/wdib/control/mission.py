@@ -6,6 +6,7 @@ from ..paths import MISSION_FILE
 
 
 def load_mission_text() -> str:
-    if not MISSION_FILE.exists():
+    try:
+        return MISSION_FILE.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return ""
-    return MISSION_FILE.read_text(encoding="utf-8")
@@ -5,6 +5,11 @@ from __future__ import annotations
 from datetime import date
 from typing import Any
 
+from ..contracts import INCIDENT_SEVERITIES, INCIDENT_STATUSES
+
+_TASK_STATUSES = frozenset({"TODO", "IN_PROGRESS", "DONE", "BLOCKED"})
+_UNVERIFIED_HARDWARE_STATUSES = frozenset({"OPEN", "DETECTED"})
+
 
 def _today() -> str:
     return date.today().isoformat()
@@ -153,7 +158,7 @@ def _append_proposed_tasks(state: dict[str, Any], proposed_tasks: list[dict[str,
         open_titles.add(title_key)
 
         status = str(item.get("status") or "TODO")
-        if status not in {"TODO", "IN_PROGRESS", "DONE", "BLOCKED"}:
+        if status not in _TASK_STATUSES:
             status = "TODO"
 
         task = {
@@ -189,7 +194,7 @@ def _append_proposed_hardware_requests(
     open_name_keys = {
         str(req.get("name") or "").strip().lower()
         for req in requests
-        if str(req.get("status") or "") in {"OPEN", "DETECTED"}
+        if str(req.get("status") or "") in _UNVERIFIED_HARDWARE_STATUSES
     }
     existing_ids = [str(req.get("id") or "") for req in requests]
 
@@ -249,9 +254,9 @@ def _append_incidents(state: dict[str, Any], proposed: list[dict[str, Any]], eve
 
         if not title or not summary:
             continue
-        if severity not in {"LOW", "MEDIUM", "HIGH"}:
+        if severity not in INCIDENT_SEVERITIES:
             severity = "MEDIUM"
-        if status not in {"OPEN", "RESOLVED"}:
+        if status not in INCIDENT_STATUSES:
             status = "OPEN"
 
         incident_id = _next_id(existing_ids, "incident")
@@ -298,7 +303,7 @@ def _derive_status(state: dict[str, Any], worker_status: str) -> str:
         return "ERROR"
 
     has_unverified_hardware = any(
-        str(req.get("status") or "") in {"OPEN", "DETECTED"}
+        str(req.get("status") or "") in _UNVERIFIED_HARDWARE_STATUSES
         for req in state.get("hardware_requests", [])
     )
     if has_unverified_hardware:
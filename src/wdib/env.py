@@ -11,15 +11,8 @@ from .paths import DEVICE_ID_FILE, ENV_FILE
 
 def load_dotenv() -> None:
     """Load key/value pairs from src/.env into process env if unset."""
-    if not ENV_FILE.exists():
-        return
-
-    for raw_line in ENV_FILE.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, _, value = line.partition("=")
-        os.environ.setdefault(key.strip(), value.strip())
+    values = _parse_env_file(ENV_FILE)
+    os.environ.update({key: value for key, value in values.items() if key not in os.environ})
 
 
 def env_bool(name: str, default: bool = False) -> bool:
@@ -50,15 +43,20 @@ def _normalize_uuid(raw: str | None) -> str | None:
 
 def _parse_env_file(path: Path) -> dict[str, str]:
     values: dict[str, str] = {}
-    if not path.exists():
+    try:
+        handle = path.open("r", encoding="utf-8")
+    except FileNotFoundError:
         return values
 
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, _, value = line.partition("=")
-        values[key.strip()] = value.strip()
+    with handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                # First occurrence wins, as with the original per-line setdefault.
+                values.setdefault(key.strip(), value.strip())
     return values
 
 
@@ -73,11 +71,13 @@ def resolve_device_id() -> str:
         os.environ.setdefault("WDIB_DEVICE_ID", from_env_file)
         return from_env_file
 
-    if DEVICE_ID_FILE.exists():
+    try:
         from_device_file = _normalize_uuid(DEVICE_ID_FILE.read_text(encoding="utf-8").strip())
-        if from_device_file:
-            os.environ.setdefault("WDIB_DEVICE_ID", from_device_file)
-            return from_device_file
+    except FileNotFoundError:
+        from_device_file = None
+    if from_device_file:
+        os.environ.setdefault("WDIB_DEVICE_ID", from_device_file)
+        return from_device_file
 
     generated = str(uuid.uuid4())
     DEVICE_ID_FILE.write_text(generated, encoding="utf-8")
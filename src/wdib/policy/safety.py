@@ -4,6 +4,13 @@ from __future__ import annotations
 
 from ..env import env_int
 
+_WORK_ORDER_CONSTRAINTS = (
+    "Work only inside allowed_paths.",
+    "Do not bypass hardware verification semantics. Hardware requests are complete only when machine-observed detection and verification pass.",
+    "Persist outcomes in the worker result contract only.",
+    "Favor minimal, testable changes and explicit evidence.",
+)
+
 
 def codex_timeout_seconds() -> int:
     return max(60, env_int("WDIB_CODEX_TIMEOUT_SECONDS", 1200))
@@ -14,9 +21,5 @@ def command_timeout_seconds() -> int:
 
 
 def work_order_constraints() -> list[str]:
-    return [
-        "Work only inside allowed_paths.",
-        "Do not bypass hardware verification semantics. Hardware requests are complete only when machine-observed detection and verification pass.",
-        "Persist outcomes in the worker result contract only.",
-        "Favor minimal, testable changes and explicit evidence.",
-    ]
+    # Fresh list per call: work orders are mutable payloads, the source stays immutable.
+    return list(_WORK_ORDER_CONSTRAINTS)
@@ -20,6 +20,7 @@ from .policy.safety import codex_timeout_seconds, command_timeout_seconds
 from .publication import build_public_daily_summary, build_public_status
 from .storage.repository import (
     append_event,
+    append_events,
     device_paths,
     load_state,
     save_public_daily_summary,
@@ -176,6 +177,7 @@ def _append_notification_events(
     day: int,
     results: list[dict[str, Any]],
 ) -> None:
+    events: list[dict[str, Any]] = []
     for result in results:
         channel = str(result.get("channel") or "unknown")
         sent = bool(result.get("sent"))
@@ -191,7 +193,8 @@ def _append_notification_events(
                 payload["status_code"] = result.get("status_code")
         else:
             payload["reason"] = str(result.get("reason") or "unknown")
-        append_event(device_id, payload)
+        events.append(payload)
+    append_events(device_id, events)
 
 
 def run_tick() -> dict[str, Any]:
@@ -340,7 +343,7 @@ def run_tick() -> dict[str, Any]:
         hardware_events = probe_hardware_requests(state, timeout_seconds=command_timeout_seconds())
         for event in hardware_events:
             event["cycle_id"] = cycle_id
-            append_event(device_id, event)
+        append_events(device_id, hardware_events)
 
         result_path = worker_result_path(device_id, cycle_id)
         paths = device_paths(device_id)
@@ -360,7 +363,7 @@ def run_tick() -> dict[str, Any]:
         work_order_file = save_work_order(device_id, cycle_id, work_order)
         for event in planning_events:
             event["cycle_id"] = cycle_id
-            append_event(device_id, event)
+        append_events(device_id, planning_events)
 
         save_state(device_id, state)
 
@@ -392,7 +395,7 @@ def run_tick() -> dict[str, Any]:
         reducer_events = apply_worker_result(state, worker_result)
         for event in reducer_events:
             event["cycle_id"] = cycle_id
-            append_event(device_id, event)
+        append_events(device_id, reducer_events)
 
         state["day"] = day
         save_state(device_id, state)
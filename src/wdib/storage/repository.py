@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
-from ..contracts import dump_json, load_json, validate_payload
+from ..contracts import dump_json, dumps_json, load_json, validate_payload
 from ..paths import (
     DEVICES_DIR,
     EVENTS_FILE_NAME,
@@ -31,7 +32,13 @@ def _now() -> str:
 
 
 def device_paths(device_id: str) -> dict[str, Path]:
-    device_dir = DEVICES_DIR / device_id
+    # Copy so callers cannot mutate the cached mapping.
+    return dict(_device_paths(DEVICES_DIR, device_id))
+
+
+@lru_cache(maxsize=32)
+def _device_paths(devices_dir: Path, device_id: str) -> dict[str, Path]:
+    device_dir = devices_dir / device_id
     runtime_dir = device_dir / RUNTIME_DIR_NAME
     public_dir = device_dir / PUBLIC_DIR_NAME
     return {
@@ -118,7 +125,9 @@ def _migrate_legacy_state(state: dict[str, Any], *, mission_path: str) -> tuple[
 def load_state(device_id: str, mission_path: str) -> dict[str, Any]:
     paths = ensure_layout(device_id)
 
-    if not paths["state"].exists():
+    try:
+        state = load_json(paths["state"])
+    except FileNotFoundError:
         state = default_state(device_id, mission_path)
         save_state(device_id, state)
         append_event(
@@ -131,11 +140,11 @@ def load_state(device_id: str, mission_path: str) -> dict[str, Any]:
         )
         return state
 
-    state = load_json(paths["state"])
     state, migrated = _migrate_legacy_state(state, mission_path=mission_path)
     validate_payload(state, "state.schema.json", label="state")
     if migrated:
-        save_state(device_id, state)
+        # Already validated above; write without a second schema pass.
+        _write_state(device_id, state)
         append_event(
             device_id,
             {
@@ -149,18 +158,30 @@ def load_state(device_id: str, mission_path: str) -> dict[str, Any]:
 
 def save_state(device_id: str, state: dict[str, Any]) -> None:
     validate_payload(state, "state.schema.json", label="state")
+    _write_state(device_id, state)
+
+
+def _write_state(device_id: str, state: dict[str, Any]) -> None:
     paths = ensure_layout(device_id)
     dump_json(paths["state"], state)
 
 
 def append_event(device_id: str, event: dict[str, Any]) -> None:
+    append_events(device_id, [event])
+
+
+def append_events(device_id: str, events: Iterable[dict[str, Any]]) -> None:
+    """Append a batch of events to the device log with a single open/write."""
+    lines = []
+    for event in events:
+        line = event.copy()
+        line.setdefault("ts", _now())
+        lines.append(dumps_json(line) + "\n")
+    if not lines:
+        return
     paths = ensure_layout(device_id)
-    line = event.copy()
-    line.setdefault("ts", _now())
     with paths["events"].open("a", encoding="utf-8") as handle:
-        import json
-
-        handle.write(json.dumps(line, sort_keys=True) + "\n")
+        handle.write("".join(lines))
 
 
 def work_order_path(device_id: str, cycle_id: str) -> Path:
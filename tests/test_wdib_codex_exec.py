@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Tests for WDIB codex subprocess output capture."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from wdib.adapters.codex_cli import _TAIL_CHARS, _run_with_tails  # noqa: E402
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+class RunWithTailsTests(unittest.TestCase):
+    def test_tail_keeps_last_chars_of_each_stream(self) -> None:
+        code = (
+            "import sys\n"
+            "sys.stdout.write('a' * 50000 + 'STDOUT-END')\n"
+            "sys.stderr.write('b' * 50000 + 'STDERR-END')\n"
+        )
+        returncode, stdout_tail, stderr_tail = _run_with_tails(_python(code), timeout_seconds=10, env=None)
+
+        self.assertEqual(returncode, 0)
+        self.assertEqual(len(stdout_tail), _TAIL_CHARS)
+        self.assertTrue(stdout_tail.endswith("STDOUT-END"))
+        self.assertEqual(len(stderr_tail), _TAIL_CHARS)
+        self.assertTrue(stderr_tail.endswith("STDERR-END"))
+
+    def test_exit_code_survives_output_past_the_tail(self) -> None:
+        code = "import sys\nsys.stdout.write('x' * 200000)\nsys.exit(7)\n"
+        returncode, stdout_tail, _ = _run_with_tails(_python(code), timeout_seconds=10, env=None)
+
+        self.assertEqual(returncode, 7)
+        self.assertEqual(stdout_tail, "x" * _TAIL_CHARS)
+
+    def test_short_output_is_kept_whole(self) -> None:
+        returncode, stdout_tail, stderr_tail = _run_with_tails(
+            _python("print('hello')"), timeout_seconds=10, env=None
+        )
+
+        self.assertEqual(returncode, 0)
+        self.assertEqual(stdout_tail.strip(), "hello")
+        self.assertEqual(stderr_tail, "")
+
+    def test_timeout_raises_timeout_expired(self) -> None:
+        with self.assertRaises(subprocess.TimeoutExpired):
+            _run_with_tails(_python("import time; time.sleep(10)"), timeout_seconds=1, env=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,11 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
-from wdib.adapters.codex_cli import _build_codex_exec_command, _prompt_from_work_order  # noqa: E402
+from wdib.adapters.codex_cli import (  # noqa: E402
+    _build_codex_exec_command,
+    _prompt_from_work_order,
+    _strip_code_fence,
+)
 
 
 class CodexPromptTests(unittest.TestCase):
@@ -34,7 +38,7 @@ class CodexPromptTests(unittest.TestCase):
         self.assertIn("make it human/environment-outcome oriented", prompt)
         self.assertIn("Do not use framework-internal becoming statements", prompt)
         self.assertIn("WORK_ORDER_JSON:", prompt)
-        self.assertIn('"objective": "Fix flaky parser task"', prompt)
+        self.assertIn('"objective":"Fix flaky parser task"', prompt)
 
     def test_prompt_disables_web_search_by_default(self) -> None:
         prompt = _prompt_from_work_order(self._work_order())
@@ -47,6 +51,15 @@ class CodexPromptTests(unittest.TestCase):
         self.assertIn("include source URLs in worker_result.summary", prompt)
         self.assertNotIn("Web search is disabled for this run.", prompt)
 
+    def test_prompt_prefix_is_shared_across_work_orders(self) -> None:
+        first = _prompt_from_work_order(self._work_order())
+        other_order = dict(self._work_order(), cycle_id="cycle-002", objective="Calibrate sensor")
+        second = _prompt_from_work_order(other_order)
+
+        prefix = first[: first.index("WORK_ORDER_JSON:")]
+        self.assertTrue(second.startswith(prefix))
+        self.assertNotIn("cycle-001", prefix)
+
     def test_build_command_omits_search_flag_when_disabled(self) -> None:
         command = _build_codex_exec_command(
             codex_bin="codex",
@@ -72,5 +85,28 @@ class CodexPromptTests(unittest.TestCase):
         self.assertIn("--search", command)
 
 
+class CodexResultFenceTests(unittest.TestCase):
+    def test_fenced_result_is_unwrapped(self) -> None:
+        raw = b'```json\n{"status": "COMPLETED"}\n```\n'
+        self.assertEqual(_strip_code_fence(raw), b'{"status": "COMPLETED"}')
+
+    def test_bare_fence_without_language_is_unwrapped(self) -> None:
+        raw = b'  ```\r\n{"status": "BLOCKED"}\r\n```'
+        self.assertEqual(_strip_code_fence(raw), b'{"status": "BLOCKED"}')
+
+    def test_fence_with_surrounding_prose_is_left_for_brace_scan(self) -> None:
+        raw = b'Here is the result:\n```json\n{"status": "COMPLETED"}\n```\nDone.'
+        stripped = _strip_code_fence(raw)
+        self.assertEqual(stripped, raw)
+        self.assertEqual(
+            stripped[stripped.find(b"{") : stripped.rfind(b"}") + 1],
+            b'{"status": "COMPLETED"}',
+        )
+
+    def test_plain_result_is_unchanged(self) -> None:
+        raw = b'{"status": "COMPLETED", "summary": "uses ``` inside"}\n'
+        self.assertEqual(_strip_code_fence(raw), raw)
+
+
 if __name__ == "__main__":
     unittest.main()
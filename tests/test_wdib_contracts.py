@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Tests for WDIB contract JSON helpers."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from wdib import contracts  # noqa: E402
+
+
+class DumpJsonTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp = Path(tmp_dir.name)
+
+    def _payload(self) -> dict[str, object]:
+        return {
+            "summary": "café ✌️",
+            "day": 3,
+            "tasks": [{"title": "naïve sensor", "done": False}, {}],
+            "notes": [],
+            "last": None,
+        }
+
+    @unittest.skipIf(contracts.orjson is None, "orjson is not installed")
+    def test_backends_write_identical_bytes_for_non_ascii(self) -> None:
+        with_orjson = self.tmp / "orjson.json"
+        with_stdlib = self.tmp / "stdlib.json"
+
+        contracts.dump_json(with_orjson, self._payload())
+        with mock.patch.object(contracts, "orjson", None):
+            contracts.dump_json(with_stdlib, self._payload())
+
+        self.assertEqual(with_orjson.read_bytes(), with_stdlib.read_bytes())
+        self.assertIn("café ✌️".encode("utf-8"), with_stdlib.read_bytes())
+
+    def test_stdlib_backend_writes_raw_utf8(self) -> None:
+        target = self.tmp / "status.json"
+
+        with mock.patch.object(contracts, "orjson", None):
+            contracts.dump_json(target, self._payload())
+
+        raw = target.read_bytes()
+        self.assertIn("café ✌️".encode("utf-8"), raw)
+        self.assertNotIn(b"\\u", raw)
+        self.assertTrue(raw.endswith(b"}\n"))
+
+    def test_existing_target_is_replaced_whole(self) -> None:
+        target = self.tmp / "state.json"
+        target.write_text('{"old": "' + "x" * 10000 + '"}\n', encoding="utf-8")
+
+        contracts.dump_json(target, {"new": True})
+
+        self.assertEqual(contracts.load_json(target), {"new": True})
+        self.assertEqual(sorted(path.name for path in self.tmp.iterdir()), ["state.json"])
+
+    def test_temp_file_is_removed_when_encoding_fails(self) -> None:
+        target = self.tmp / "state.json"
+        target.write_text('{"old": true}\n', encoding="utf-8")
+        backends = [None] if contracts.orjson is None else [contracts.orjson, None]
+
+        for backend in backends:
+            with self.subTest(orjson=backend is not None):
+                with mock.patch.object(contracts, "orjson", backend):
+                    with self.assertRaises(TypeError):
+                        contracts.dump_json(target, {"a": 1, "b": object()})
+
+                self.assertEqual(target.read_text(encoding="utf-8"), '{"old": true}\n')
+                self.assertEqual(sorted(path.name for path in self.tmp.iterdir()), ["state.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Tests for WDIB environment helpers."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from wdib import env  # noqa: E402
+
+
+class LoadDotenvTests(unittest.TestCase):
+    def _env_file(self, text: str) -> Path:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        path = Path(tmp_dir.name) / ".env"
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_first_occurrence_of_a_repeated_key_wins(self) -> None:
+        env_file = self._env_file(
+            "# comment\n"
+            "WDIB_TEST_REPEATED=first\n"
+            "WDIB_TEST_REPEATED=second\n"
+            "WDIB_TEST_OTHER = spaced value \n"
+            "not a pair\n"
+        )
+
+        with mock.patch.object(env, "ENV_FILE", env_file), mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("WDIB_TEST_REPEATED", None)
+            os.environ.pop("WDIB_TEST_OTHER", None)
+            env.load_dotenv()
+
+            self.assertEqual(os.environ["WDIB_TEST_REPEATED"], "first")
+            self.assertEqual(os.environ["WDIB_TEST_OTHER"], "spaced value")
+
+    def test_existing_environment_is_not_overridden(self) -> None:
+        env_file = self._env_file("WDIB_TEST_PRESET=from-file\n")
+
+        with mock.patch.object(env, "ENV_FILE", env_file), mock.patch.dict(
+            os.environ, {"WDIB_TEST_PRESET": "from-process"}, clear=False
+        ):
+            env.load_dotenv()
+
+            self.assertEqual(os.environ["WDIB_TEST_PRESET"], "from-process")
+
+    def test_missing_env_file_is_ignored(self) -> None:
+        missing = Path(tempfile.gettempdir()) / "wdib-missing-dir" / ".env"
+
+        with mock.patch.object(env, "ENV_FILE", missing):
+            env.load_dotenv()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for WDIB git publication adapter."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from wdib.adapters import git_repo  # noqa: E402
+
+DEVICE_ID = "11111111-2222-4333-8444-555555555555"
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+class GitRepoTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        self.repo = Path(tmp_dir.name) / "repo"
+        self.repo.mkdir()
+        _git(self.repo, "init", "-q")
+
+        # Real device layout: only public/ is published, the rest stays untracked.
+        device_dir = self.repo / "devices" / DEVICE_ID
+        (device_dir / "public").mkdir(parents=True)
+        (device_dir / "sessions").mkdir()
+        (device_dir / "runtime").mkdir()
+        (device_dir / "public" / "status.json").write_text('{"day": 1}\n', encoding="utf-8")
+        (device_dir / "state.json").write_text("{}\n", encoding="utf-8")
+        (device_dir / "events.ndjson").write_text("{}\n", encoding="utf-8")
+        (device_dir / "sessions" / "day_001.json").write_text("{}\n", encoding="utf-8")
+        (device_dir / "runtime" / "human_message.txt").write_text("hi\n", encoding="utf-8")
+        self.status_file = device_dir / "public" / "status.json"
+
+        patcher = mock.patch.object(git_repo, "PROJECT_ROOT", self.repo)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        env = mock.patch.dict(
+            os.environ,
+            {
+                "WDIB_SKIP_GIT_COMMIT": "false",
+                "WDIB_GIT_AUTO_PUSH": "false",
+                "WDIB_GIT_USER_NAME": "WDIB Test",
+                "WDIB_GIT_USER_EMAIL": "wdib@example.com",
+                "WDIB_GIT_REMOTE": "origin",
+                "WDIB_GIT_BRANCH": "",
+            },
+        )
+        env.start()
+        self.addCleanup(env.stop)
+
+    def _commit(self) -> dict[str, object]:
+        return git_repo.commit_device_changes(DEVICE_ID, 1, "ACTIVE")
+
+    def test_commits_public_changes_only(self) -> None:
+        result = self._commit()
+
+        self.assertTrue(result["committed"])
+        self.assertEqual(result["message"], "11111111 day 001 - ACTIVE")
+        committed_files = _git(self.repo, "show", "--name-only", "--format=", "HEAD").split()
+        self.assertEqual(committed_files, [f"devices/{DEVICE_ID}/public/status.json"])
+
+    def test_no_change_with_untracked_siblings_is_not_an_error(self) -> None:
+        self._commit()
+
+        result = self._commit()
+
+        self.assertFalse(result["committed"])
+        self.assertFalse(result["pushed"])
+        self.assertEqual(result["message"], "No device changes to commit.")
+
+    def _push_env(self, remote: str) -> mock._patch:
+        return mock.patch.dict(os.environ, {"WDIB_GIT_AUTO_PUSH": "true", "WDIB_GIT_REMOTE": remote})
+
+    def test_push_to_configured_remote(self) -> None:
+        remote_dir = self.repo.parent / "remote.git"
+        _git(self.repo.parent, "init", "-q", "--bare", str(remote_dir))
+        _git(self.repo, "remote", "add", "origin", str(remote_dir))
+
+        with self._push_env("origin"), mock.patch.dict(os.environ, {"WDIB_GIT_BRANCH": "main"}):
+            result = self._commit()
+
+        self.assertTrue(result["committed"])
+        self.assertTrue(result["pushed"])
+        self.assertEqual(
+            _git(remote_dir, "rev-parse", "main"),
+            _git(self.repo, "rev-parse", "HEAD"),
+        )
+
+    def test_unknown_remote_is_reported_as_not_configured(self) -> None:
+        with self._push_env("nowhere"):
+            result = self._commit()
+
+        self.assertTrue(result["committed"])
+        self.assertFalse(result["pushed"])
+        self.assertIn("remote 'nowhere' not configured", str(result["message"]))
+
+    def test_failed_push_reports_git_error(self) -> None:
+        _git(self.repo, "remote", "add", "origin", str(self.repo.parent / "missing.git"))
+
+        with self._push_env("origin"), mock.patch.dict(os.environ, {"WDIB_GIT_BRANCH": "main"}):
+            result = self._commit()
+
+        self.assertTrue(result["committed"])
+        self.assertFalse(result["pushed"])
+        self.assertIn("push failed:", str(result["message"]))
+        self.assertNotIn("not configured", str(result["message"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
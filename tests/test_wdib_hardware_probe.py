@@ -3,15 +3,17 @@
 
 from __future__ import annotations
 
+import os
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
-from wdib.control.hardware import probe_hardware_requests  # noqa: E402
+from wdib.control.hardware import _MAX_OUTPUT_BYTES, _run_shell, probe_hardware_requests  # noqa: E402
 
 
 class HardwareProbeTests(unittest.TestCase):
@@ -83,6 +85,69 @@ class HardwareProbeTests(unittest.TestCase):
         self.assertEqual(events[0]["from"], "DETECTED")
         self.assertEqual(events[0]["to"], "OPEN")
 
+    def test_lsusb_contains_searches_past_the_evidence_cap(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fake_lsusb = Path(tmp_dir) / "lsusb"
+            fake_lsusb.write_text(
+                "#!/bin/sh\n"
+                "i=0\n"
+                "while [ $i -lt 80 ]; do\n"
+                "  echo \"Bus 001 Device $i: ID 1d6b:0002 Linux Foundation 2.0 root hub padding padding\"\n"
+                "  i=$((i+1))\n"
+                "done\n"
+                "echo \"Bus 002 Device 003: ID 2341:0043 Arduino SA Uno R3\"\n",
+                encoding="utf-8",
+            )
+            fake_lsusb.chmod(0o755)
+
+            state = {
+                "hardware_requests": [
+                    {
+                        "id": "hardware-001",
+                        "name": "Arduino Uno",
+                        "reason": "Need GPIO",
+                        "status": "DETECTED",
+                        "detection": {"kind": "lsusb_contains", "value": "2341:0043"},
+                        "verify_command": "",
+                        "requested_on": "2026-02-24",
+                        "last_checked_on": None,
+                        "detected_on": "2026-02-24",
+                        "verified_on": None,
+                        "verify_failures": 0,
+                        "notes": "",
+                    }
+                ]
+            }
+
+            path = f"{tmp_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+            with mock.patch.dict(os.environ, {"PATH": path}):
+                probe_hardware_requests(state, timeout_seconds=5)
+
+        self.assertEqual(state["hardware_requests"][0]["status"], "VERIFIED")
+
+
+class RunShellTests(unittest.TestCase):
+    def test_timeout_is_reported(self) -> None:
+        ok, output = _run_shell("sleep 5", 1)
+        self.assertFalse(ok)
+        self.assertEqual(output, "timeout after 1s")
+
+    def test_large_output_is_bounded(self) -> None:
+        ok, output = _run_shell("head -c 100000 /dev/zero | tr '\\0' a", 5)
+        self.assertTrue(ok)
+        self.assertEqual(len(output), _MAX_OUTPUT_BYTES)
+
+    def test_exit_code_survives_output_past_the_cap(self) -> None:
+        ok, output = _run_shell("head -c 100000 /dev/zero | tr '\\0' a; exit 3", 5)
+        self.assertFalse(ok)
+        self.assertEqual(len(output), _MAX_OUTPUT_BYTES)
+
+    def test_stderr_is_merged_into_output(self) -> None:
+        ok, output = _run_shell("echo out; echo err >&2", 5)
+        self.assertTrue(ok)
+        self.assertIn("out", output)
+        self.assertIn("err", output)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for WDIB device storage."""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from wdib.storage import repository  # noqa: E402
+
+DEVICE_ID = "11111111-2222-4333-8444-555555555555"
+
+
+class AppendEventsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        patcher = mock.patch.object(repository, "DEVICES_DIR", Path(tmp_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.events_file = repository.device_paths(DEVICE_ID)["events"]
+
+    def _lines(self) -> list[dict[str, object]]:
+        return [json.loads(line) for line in self.events_file.read_text(encoding="utf-8").splitlines()]
+
+    def test_batch_is_written_as_ordered_ndjson(self) -> None:
+        repository.append_event(DEVICE_ID, {"type": "FIRST", "ts": "2026-03-01T10:00:00"})
+        repository.append_events(
+            DEVICE_ID,
+            [
+                {"type": "SECOND", "ts": "2026-03-01T10:00:01"},
+                {"type": "THIRD"},
+            ],
+        )
+
+        lines = self._lines()
+        self.assertEqual([line["type"] for line in lines], ["FIRST", "SECOND", "THIRD"])
+        self.assertEqual(lines[1]["ts"], "2026-03-01T10:00:01")
+        self.assertTrue(str(lines[2]["ts"]))
+        self.assertTrue(self.events_file.read_text(encoding="utf-8").endswith("\n"))
+
+    def test_caller_events_are_not_mutated(self) -> None:
+        event = {"type": "NO_TS"}
+
+        repository.append_events(DEVICE_ID, [event])
+
+        self.assertNotIn("ts", event)
+        self.assertIn("ts", self._lines()[0])
+
+    def test_empty_batch_writes_nothing(self) -> None:
+        repository.append_events(DEVICE_ID, iter(()))
+
+        self.assertFalse(self.events_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()